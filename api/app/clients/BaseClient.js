@@ -1361,14 +1361,13 @@ class BaseClient {
       }
     }
 
-    /**
-     *
-     * @param {TMessage} message
-     */
-    const processMessage = async (message) => {
-      if (!this.message_file_map) {
-        /** @type {Record<string, MongoFile[]> */
-        this.message_file_map = {};
+    /** @type {Map<TMessage, string[]>} */
+    const messageFileIds = new Map();
+    const allFileIds = [];
+
+    for (const message of _messages) {
+      if (!message.files) {
+        continue;
       }
 
       const fileIds = [];
@@ -1380,17 +1379,52 @@ class BaseClient {
         seen.add(file.file_id);
       }
 
-      if (fileIds.length === 0) {
-        return message;
+      if (fileIds.length > 0) {
+        messageFileIds.set(message, fileIds);
+        allFileIds.push(...fileIds);
       }
+    }
 
-      const files = await getFiles(
+    /**
+     * Single lookup for all previous attachments, instead of one query per message
+     * @type {Map<string, MongoFile>}
+     */
+    const filesById = new Map();
+    if (allFileIds.length > 0) {
+      const dbFiles = await getFiles(
         {
-          file_id: { $in: fileIds },
+          file_id: { $in: allFileIds },
         },
         {},
         {},
       );
+      for (const file of dbFiles ?? []) {
+        filesById.set(file.file_id, file);
+      }
+    }
+
+    /**
+     *
+     * @param {TMessage} message
+     */
+    const processMessage = async (message) => {
+      if (!this.message_file_map) {
+        /** @type {Record<string, MongoFile[]> */
+        this.message_file_map = {};
+      }
+
+      const fileIds = messageFileIds.get(message);
+      if (!fileIds) {
+        return message;
+      }
+
+      const files = [];
+      for (const fileId of fileIds) {
+        const file = filesById.get(fileId);
+        if (file) {
+          files.push(file);
+        }
+      }
 
       await this.addFileContextToMessage(message, files);
       await this.processAttachments(message, files);
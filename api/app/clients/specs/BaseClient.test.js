@@ -40,6 +40,12 @@ jest.mock('~/models', () => ({
 
 const { getConvo, saveConvo } = require('~/models');
 
+jest.mock('~/models/File', () => ({
+  getFiles: jest.fn(),
+}));
+
+const { getFiles } = require('~/models/File');
+
 jest.mock('@librechat/agents', () => {
   const { Providers } = jest.requireActual('@librechat/agents');
   return {
@@ -928,4 +934,47 @@ describe('BaseClient', () => {
       expect(result.remainingContextTokens).toBe(2); // 25 - 20 - 3(assistant label)
     });
   });
+
+  describe('addPreviousAttachments', () => {
+    beforeEach(() => {
+      getFiles.mockReset();
+      TestClient.options = { ...TestClient.options, resendFiles: true };
+      TestClient.addFileContextToMessage = jest.fn();
+      TestClient.processAttachments = jest.fn();
+      TestClient.checkVisionRequest = jest.fn();
+    });
+
+    test('fetches files for all messages with a single query', async () => {
+      getFiles.mockResolvedValue([
+        { file_id: 'file-a', type: 'text/plain' },
+        { file_id: 'file-b', type: 'text/plain' },
+      ]);
+
+      const messages = [
+        { messageId: 'msg-1', files: [{ file_id: 'file-a' }] },
+        { messageId: 'msg-2' },
+        { messageId: 'msg-3', files: [{ file_id: 'file-b' }, { file_id: 'file-a' }] },
+      ];
+
+      const result = await TestClient.addPreviousAttachments(messages);
+
+      expect(result).toEqual(messages);
+      expect(getFiles).toHaveBeenCalledTimes(1);
+      expect(getFiles).toHaveBeenCalledWith({ file_id: { $in: ['file-a', 'file-b'] } }, {}, {});
+      expect(TestClient.message_file_map['msg-1']).toEqual([
+        { file_id: 'file-a', type: 'text/plain' },
+      ]);
+      expect(TestClient.message_file_map['msg-3']).toEqual([
+        { file_id: 'file-b', type: 'text/plain' },
+      ]);
+    });
+
+    test('skips the query when no messages have new files', async () => {
+      const messages = [{ messageId: 'msg-1' }, { messageId: 'msg-2', files: [] }];
+
+      await TestClient.addPreviousAttachments(messages);
+
+      expect(getFiles).not.toHaveBeenCalled();
+    });
+  });
 });
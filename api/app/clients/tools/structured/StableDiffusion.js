@@ -123,9 +123,7 @@ class StableDiffusionAPI extends Tool {
     const filepath = path.join(imageOutputPath, this.userId, imageName);
     this.relativePath = path.relative(clientPath, imageOutputPath);
 
-    if (!fs.existsSync(path.join(imageOutputPath, this.userId))) {
-      fs.mkdirSync(path.join(imageOutputPath, this.userId), { recursive: true });
-    }
+    await fs.promises.mkdir(path.join(imageOutputPath, this.userId), { recursive: true });
 
     try {
       if (this.isAgent) {
@@ -292,7 +292,7 @@ module.exports = {
   deleteConvos: async (user, filter) => {
     try {
       const userFilter = { ...filter, user };
-      const conversations = await Conversation.find(userFilter).select('conversationId');
+      const conversations = await Conversation.find(userFilter).select('conversationId').lean();
       const conversationIds = conversations.map((c) => c.conversationId);
 
       if (!conversationIds.length) {
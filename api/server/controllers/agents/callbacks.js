@@ -417,14 +417,22 @@ function createToolEndCallback({ req, res, artifactPromises }) {
       return;
     }
 
+    /** @type {Promise<Record<string, string>> | undefined} */
+    let authValuesPromise;
+    /** All output files share the same code API key, so load it once per tool call */
+    const getAuthValues = () => {
+      authValuesPromise ??= loadAuthValues({
+        userId: req.user.id,
+        authFields: [EnvVar.CODE_API_KEY],
+      });
+      return authValuesPromise;
+    };
+
     for (const file of output.artifact.files) {
       const { id, name } = file;
       artifactPromises.push(
         (async () => {
-          const result = await loadAuthValues({
-            userId: req.user.id,
-            authFields: [EnvVar.CODE_API_KEY],
-          });
+          const result = await getAuthValues();
           const fileMetadata = await processCodeOutput({
             req,
             id,
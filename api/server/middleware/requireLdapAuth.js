@@ -1,18 +1,14 @@
 const passport = require('passport');
+const { logger } = require('@librechat/data-schemas');
 
 const requireLdapAuth = (req, res, next) => {
   passport.authenticate('ldapauth', (err, user, info) => {
     if (err) {
-      console.log({
-        title: '(requireLdapAuth) Error at passport.authenticate',
-        parameters: [{ name: 'error', value: err }],
-      });
+      logger.error('[requireLdapAuth] Error at passport.authenticate:', err);
       return next(err);
     }
     if (!user) {
-      console.log({
-        title: '(requireLdapAuth) Error: No user',
-      });
+      logger.debug('[requireLdapAuth] Error: No user');
       return res.status(404).send(info);
     }
     req.user = user;
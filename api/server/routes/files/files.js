@@ -358,6 +358,15 @@ router.get('/download/:userId/:file_id', fileAccess, async (req, res) => {
       });
 
       setHeaders();
+      /** Disk-backed streams have a known size, so send it instead of chunked encoding */
+      if (typeof fileStream.path === 'string') {
+        try {
+          const { size } = await fs.stat(fileStream.path);
+          res.setHeader('Content-Length', size);
+        } catch (error) {
+          logger.debug('[DOWNLOAD ROUTE] Could not determine file size:', error);
+        }
+      }
       fileStream.pipe(res);
     }
   } catch (error) {
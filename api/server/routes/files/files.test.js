@@ -1,4 +1,8 @@
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
 const express = require('express');
+const { Readable } = require('stream');
 const request = require('supertest');
 const mongoose = require('mongoose');
 const { v4: uuidv4 } = require('uuid');
@@ -53,6 +57,7 @@ jest.mock('~/config', () => ({
 }));
 
 const { processDeleteRequest } = require('~/server/services/Files/process');
+const { getStrategyFunctions } = require('~/server/services/Files/strategies');
 
 // Import the router after mocks
 const router = require('./files');
@@ -423,4 +428,71 @@ describe('File Routes - Delete with Agent Access', () => {
       expect(processDeleteRequest).not.toHaveBeenCalled();
     });
   });
+
+  describe('GET /files/download/:userId/:file_id', () => {
+    let tempDir;
+    let downloadApp;
+
+    beforeEach(() => {
+      tempDir = fs.mkdtempSync(path.join(os.tmpdir(), 'files-download-test-'));
+
+      downloadApp = express();
+      downloadApp.use((req, res, next) => {
+        req.user = { id: otherUserId.toString(), role: SystemRoles.USER };
+        next();
+      });
+      downloadApp.use('/files', router);
+    });
+
+    afterEach(() => {
+      fs.rmSync(tempDir, { recursive: true, force: true });
+    });
+
+    const createUserFile = async (filepath) => {
+      const userFileId = uuidv4();
+      await createFile({
+        user: otherUserId,
+        file_id: userFileId,
+        filename: 'download.txt',
+        filepath,
+        bytes: 0,
+        type: 'text/plain',
+      });
+      return userFileId;
+    };
+
+    it('should send Content-Length for disk-backed download streams', async () => {
+      const content = 'local file content for download';
+      const filepath = path.join(tempDir, 'download.txt');
+      fs.writeFileSync(filepath, content);
+      const userFileId = await createUserFile(filepath);
+
+      getStrategyFunctions.mockReturnValueOnce({
+        getDownloadStream: jest.fn(async () => fs.createReadStream(filepath)),
+      });
+
+      const response = await request(downloadApp).get(
+        `/files/download/${otherUserId}/${userFileId}`,
+      );
+
+      expect(response.status).toBe(200);
+      expect(response.headers['content-length']).toBe(String(fs.statSync(filepath).size));
+      expect(response.headers['content-disposition']).toContain('download.txt');
+    });
+
+    it('should omit Content-Length for streams without a file path', async () => {
+      const userFileId = await createUserFile('/uploads/remote/download.txt');
+
+      getStrategyFunctions.mockReturnValueOnce({
+        getDownloadStream: jest.fn(async () => Readable.from([Buffer.from('remote content')])),
+      });
+
+      const response = await request(downloadApp).get(
+        `/files/download/${otherUserId}/${userFileId}`,
+      );
+
+      expect(response.status).toBe(200);
+      expect(response.headers['content-length']).toBeUndefined();
+    });
+  });
 });
@@ -14,10 +14,7 @@ const storage = multer.diskStorage({
   destination: function (req, file, cb) {
     const appConfig = req.config;
     const outputPath = path.join(appConfig.paths.uploads, 'temp', req.user.id);
-    if (!fs.existsSync(outputPath)) {
-      fs.mkdirSync(outputPath, { recursive: true });
-    }
-    cb(null, outputPath);
+    fs.mkdir(outputPath, { recursive: true }, (err) => cb(err, outputPath));
   },
   filename: function (req, file, cb) {
     req.file_id = crypto.randomUUID();
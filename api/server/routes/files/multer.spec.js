@@ -446,15 +446,21 @@ describe('Multer Configuration', () => {
       }).not.toThrow();
     });
 
-    it('should handle file system errors when directory creation fails', () => {
-      // Test with a non-existent parent directory to simulate fs issues
-      const invalidPath = '/nonexistent/path/that/should/not/exist';
+    it('should pass file system errors to the callback when directory creation fails', (done) => {
+      // A path nested under a regular file cannot be created, regardless of permissions
+      const invalidPath = path.join(tempDir, 'not-a-directory');
+      fs.writeFileSync(invalidPath, 'content');
       mockReq.config.paths.uploads = invalidPath;
 
-      // The current implementation doesn't catch errors, so they're thrown synchronously
-      expect(() => {
-        storage.getDestination(mockReq, mockFile, jest.fn());
-      }).toThrow();
+      const cb = jest.fn((err, destination) => {
+        // fs errors come from another realm, so match on shape rather than `instanceof`
+        expect(Object.prototype.toString.call(err)).toBe('[object Error]');
+        expect(err.code).toBe('ENOTDIR');
+        expect(destination).toBe(path.join(invalidPath, 'temp', 'test-user-123'));
+        done();
+      });
+
+      expect(() => storage.getDestination(mockReq, mockFile, cb)).not.toThrow();
     });
 
     it('should handle malformed filenames with real sanitization', (done) => {
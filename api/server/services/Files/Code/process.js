@@ -95,12 +95,23 @@ const processCodeOutput = async ({
   }
 };
 
+/** Code environment files expire after 24 hours; treat them as stale an hour early */
+const ACTIVE_FILE_WINDOW_MS = 23 * 60 * 60 * 1000;
+
 function checkIfActive(dateString) {
-  const givenDate = new Date(dateString);
-  const currentDate = new Date();
-  const timeDifference = currentDate - givenDate;
-  const hoursPassed = timeDifference / (1000 * 60 * 60);
-  return hoursPassed < 23;
+  return Date.now() - Date.parse(dateString) < ACTIVE_FILE_WINDOW_MS;
+}
+
+/**
+ * Splits a code environment file identifier (`session_id/id?query`) into its parts.
+ *
+ * @param {string} fileIdentifier - The identifier for the file (e.g., "session_id/fileId").
+ * @returns {{ session_id: string; id: string; queryString: string | undefined }}
+ */
+function parseFileIdentifier(fileIdentifier) {
+  const [filePath, queryString] = fileIdentifier.split('?');
+  const [session_id, id] = filePath.split('/');
+  return { session_id, id, queryString };
 }
 
 /**
@@ -189,6 +200,26 @@ const primeFiles = async (options, apiKey) => {
   const sessions = new Map();
   let toolContext = '';
 
+  /**
+   * Session lookups are independent of each other, so fetch the upload time for the
+   * first file of each session concurrently rather than one session at a time.
+   * @type {Map<string, { fileIdentifier: string; uploadTime: Promise<string | null> }>}
+   */
+  const sessionLookups = new Map();
+  for (const file of dbFiles) {
+    const fileIdentifier = file?.metadata?.fileIdentifier;
+    if (!fileIdentifier) {
+      continue;
+    }
+    const { session_id } = parseFileIdentifier(fileIdentifier);
+    if (!sessionLookups.has(session_id)) {
+      sessionLookups.set(session_id, {
+        fileIdentifier,
+        uploadTime: getSessionInfo(fileIdentifier, apiKey),
+      });
+    }
+  }
+
   for (let i = 0; i < dbFiles.length; i++) {
     const file = dbFiles[i];
     if (!file) {
@@ -196,8 +227,7 @@ const primeFiles = async (options, apiKey) => {
     }
 
     if (file.metadata.fileIdentifier) {
-      const [path, queryString] = file.metadata.fileIdentifier.split('?');
-      const [session_id, id] = path.split('/');
+      const { session_id, id, queryString } = parseFileIdentifier(file.metadata.fileIdentifier);
 
       const pushFile = () => {
         if (!toolContext) {
@@ -257,7 +287,11 @@ const primeFiles = async (options, apiKey) => {
           );
         }
       };
-      const uploadTime = await getSessionInfo(file.metadata.fileIdentifier, apiKey);
+      const lookup = sessionLookups.get(session_id);
+      const uploadTime =
+        lookup?.fileIdentifier === file.metadata.fileIdentifier
+          ? await lookup.uploadTime
+          : await getSessionInfo(file.metadata.fileIdentifier, apiKey);
       if (!uploadTime) {
         logger.warn(`Failed to get upload time for file ${id} in session ${session_id}`);
         await reuploadFile();
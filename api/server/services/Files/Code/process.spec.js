@@ -0,0 +1,131 @@
+jest.mock('axios', () => jest.fn());
+
+jest.mock('@librechat/data-schemas', () => ({
+  ...jest.requireActual('@librechat/data-schemas'),
+  logger: {
+    info: jest.fn(),
+    warn: jest.fn(),
+    debug: jest.fn(),
+    error: jest.fn(),
+  },
+}));
+
+jest.mock('@librechat/api', () => ({
+  logAxiosError: jest.fn(),
+}));
+
+jest.mock('@librechat/agents', () => ({
+  getCodeBaseURL: jest.fn(() => 'https://code.example.com'),
+}));
+
+jest.mock('~/server/services/Files/permissions', () => ({
+  filterFilesByAgentAccess: jest.fn(),
+}));
+
+jest.mock('~/server/services/Files/strategies', () => ({
+  getStrategyFunctions: jest.fn(),
+}));
+
+jest.mock('~/server/services/Files/images/convert', () => ({
+  convertImage: jest.fn(),
+}));
+
+jest.mock('~/models/File', () => ({
+  createFile: jest.fn(),
+  getFiles: jest.fn(),
+  updateFile: jest.fn(),
+}));
+
+const axios = require('axios');
+const { EToolResources } = require('librechat-data-provider');
+const { getStrategyFunctions } = require('~/server/services/Files/strategies');
+const { getFiles } = require('~/models/File');
+const { primeFiles } = require('./process');
+
+const createFile = (session_id, id) => ({
+  file_id: `file-${id}`,
+  filename: `${id}.txt`,
+  filepath: `/uploads/${id}.txt`,
+  source: 'local',
+  metadata: { fileIdentifier: `${session_id}/${id}` },
+});
+
+const sessionResponse = (session_id, ids, lastModified) => ({
+  data: ids.map((id) => ({ name: `${session_id}/${id}`, lastModified })),
+});
+
+const tool_resources = (files) => ({
+  [EToolResources.execute_code]: { file_ids: files.map((file) => file.file_id) },
+});
+
+describe('primeFiles', () => {
+  const apiKey = 'test-api-key';
+  const fresh = () => new Date().toISOString();
+  const stale = () => new Date(Date.now() - 48 * 60 * 60 * 1000).toISOString();
+
+  it('should look up distinct sessions concurrently, once per session', async () => {
+    const files = [createFile('session-a', 'one'), createFile('session-b', 'two')];
+    getFiles.mockResolvedValue(files);
+
+    const pending = [];
+    axios.mockImplementation(
+      ({ url }) =>
+        new Promise((resolve) => {
+          pending.push({ url, resolve });
+        }),
+    );
+
+    const resultPromise = primeFiles({ tool_resources: tool_resources(files) }, apiKey);
+    await new Promise((resolve) => setImmediate(resolve));
+
+    expect(axios).toHaveBeenCalledTimes(2);
+    expect(pending.map(({ url }) => url)).toEqual([
+      'https://code.example.com/files/session-a',
+      'https://code.example.com/files/session-b',
+    ]);
+
+    pending[0].resolve(sessionResponse('session-a', ['one'], fresh()));
+    pending[1].resolve(sessionResponse('session-b', ['two'], fresh()));
+
+    const { files: primed } = await resultPromise;
+    expect(primed).toEqual([
+      { id: 'one', session_id: 'session-a', name: 'one.txt' },
+      { id: 'two', session_id: 'session-b', name: 'two.txt' },
+    ]);
+    expect(axios).toHaveBeenCalledTimes(2);
+  });
+
+  it('should not look up a session again once one of its files is active', async () => {
+    const files = [createFile('session-a', 'one'), createFile('session-a', 'two')];
+    getFiles.mockResolvedValue(files);
+    axios.mockResolvedValue(sessionResponse('session-a', ['one', 'two'], fresh()));
+
+    const { files: primed, toolContext } = await primeFiles(
+      { tool_resources: tool_resources(files) },
+      apiKey,
+    );
+
+    expect(axios).toHaveBeenCalledTimes(1);
+    expect(primed.map(({ id }) => id)).toEqual(['one', 'two']);
+    expect(toolContext).toContain('/mnt/data/one.txt');
+    expect(toolContext).toContain('/mnt/data/two.txt');
+  });
+
+  it('should fall back to a per-file lookup when the first file of a session fails to re-upload', async () => {
+    const files = [createFile('session-a', 'one'), createFile('session-a', 'two')];
+    getFiles.mockResolvedValue(files);
+    axios
+      .mockResolvedValueOnce(sessionResponse('session-a', ['one'], stale()))
+      .mockResolvedValueOnce(sessionResponse('session-a', ['two'], fresh()));
+
+    const getDownloadStream = jest.fn().mockRejectedValue(new Error('File not found'));
+    getStrategyFunctions.mockReturnValue({ getDownloadStream, handleFileUpload: jest.fn() });
+
+    const { files: primed } = await primeFiles({ tool_resources: tool_resources(files) }, apiKey);
+
+    expect(getDownloadStream).toHaveBeenCalledTimes(1);
+    expect(axios).toHaveBeenCalledTimes(2);
+    expect(axios.mock.calls[1][0].url).toBe('https://code.example.com/files/session-a');
+    expect(primed).toEqual([{ id: 'two', session_id: 'session-a', name: 'two.txt' }]);
+  });
+});
@@ -8,6 +8,26 @@ const { resizeImageBuffer } = require('~/server/services/Files/images/resize');
 const { getBufferMetadata } = require('~/server/utils');
 const paths = require('~/config/paths');
 
+/**
+ * Moves a file, renaming it in place when source and destination share a filesystem
+ * and falling back to a copy followed by unlink across devices.
+ *
+ * @param {string} sourcePath - The current path of the file.
+ * @param {string} destinationPath - The path to move the file to.
+ * @returns {Promise<void>}
+ */
+async function moveFile(sourcePath, destinationPath) {
+  try {
+    await fs.promises.rename(sourcePath, destinationPath);
+  } catch (error) {
+    if (error.code !== 'EXDEV') {
+      throw error;
+    }
+    await fs.promises.copyFile(sourcePath, destinationPath);
+    await fs.promises.unlink(sourcePath);
+  }
+}
+
 /**
  * Saves a file to a specified output path with a new filename.
  *
@@ -19,15 +39,12 @@ const paths = require('~/config/paths');
  */
 async function saveLocalFile(file, outputPath, outputFilename) {
   try {
-    if (!fs.existsSync(outputPath)) {
-      fs.mkdirSync(outputPath, { recursive: true });
-    }
+    await fs.promises.mkdir(outputPath, { recursive: true });
 
     const fileExtension = path.extname(file.originalname);
     const filenameWithExt = outputFilename + fileExtension;
     const outputFilePath = path.join(outputPath, filenameWithExt);
-    fs.copyFileSync(file.path, outputFilePath);
-    fs.unlinkSync(file.path);
+    await moveFile(file.path, outputFilePath);
 
     return outputFilePath;
   } catch (error) {
@@ -69,11 +86,9 @@ async function saveLocalBuffer({ userId, buffer, fileName, basePath = 'images' }
 
     const directoryPath = path.join(basePath === 'images' ? publicPath : uploads, basePath, userId);
 
-    if (!fs.existsSync(directoryPath)) {
-      fs.mkdirSync(directoryPath, { recursive: true });
-    }
+    await fs.promises.mkdir(directoryPath, { recursive: true });
 
-    fs.writeFileSync(path.join(directoryPath, fileName), buffer);
+    await fs.promises.writeFile(path.join(directoryPath, fileName), buffer);
 
     const filePath = path.posix.join('/', basePath, userId, fileName);
 
@@ -115,10 +130,8 @@ async function saveFileFromURL({ userId, URL, fileName, basePath = 'images' }) {
     // Construct the outputPath based on the basePath and userId
     const outputPath = path.join(paths.publicPath, basePath, userId.toString());
 
-    // Check if the output directory exists, if not, create it
-    if (!fs.existsSync(outputPath)) {
-      fs.mkdirSync(outputPath, { recursive: true });
-    }
+    // Ensure the output directory exists
+    await fs.promises.mkdir(outputPath, { recursive: true });
 
     // Replace or append the correct extension
     const extRegExp = new RegExp(path.extname(fileName) + '$');
@@ -129,7 +142,7 @@ async function saveFileFromURL({ userId, URL, fileName, basePath = 'images' }) {
 
     // Save the file to the output path
     const outputFilePath = path.join(outputPath, fileName);
-    fs.writeFileSync(outputFilePath, buffer);
+    await fs.promises.writeFile(outputFilePath, buffer);
 
     return {
       bytes,
@@ -271,25 +284,25 @@ const deleteLocalFile = async (req, file) => {
 async function uploadLocalFile({ req, file, file_id }) {
   const appConfig = req.config;
   const inputFilePath = file.path;
-  const inputBuffer = await fs.promises.readFile(inputFilePath);
-  const bytes = Buffer.byteLength(inputBuffer);
 
   const { uploads } = appConfig.paths;
   const userPath = path.join(uploads, req.user.id);
 
-  if (!fs.existsSync(userPath)) {
-    fs.mkdirSync(userPath, { recursive: true });
-  }
+  await fs.promises.mkdir(userPath, { recursive: true });
 
   const fileName = `${file_id}__${path.basename(inputFilePath)}`;
   const newPath = path.join(userPath, fileName);
 
-  await fs.promises.writeFile(newPath, inputBuffer);
+  /** Copy on disk instead of buffering the whole upload in memory */
+  await fs.promises.copyFile(inputFilePath, newPath);
+  /** Multer already records the size it wrote; only stat when it is unavailable */
+  const bytes = typeof file.size === 'number' ? file.size : (await fs.promises.stat(newPath)).size;
   const filepath = path.posix.join('/', 'uploads', req.user.id, path.basename(newPath));
 
   let height, width;
   if (file.mimetype && file.mimetype.startsWith('image/')) {
     try {
+      const inputBuffer = await fs.promises.readFile(newPath);
       const { width: imgWidth, height: imgHeight } = await resizeImageBuffer(inputBuffer, 'high');
       height = imgHeight;
       width = imgWidth;
@@ -0,0 +1,64 @@
+const fs = require('fs');
+const path = require('path');
+
+jest.mock('@librechat/api', () => ({
+  generateShortLivedToken: jest.fn(),
+}));
+
+jest.mock('~/server/services/Files/images/resize', () => ({
+  resizeImageBuffer: jest.fn(),
+}));
+
+jest.mock('~/server/utils', () => ({
+  getBufferMetadata: jest.fn(),
+}));
+
+const { saveLocalFile } = require('./crud');
+
+describe('saveLocalFile', () => {
+  const outputPath = path.join('/uploads', 'user-123');
+  const file = { originalname: 'report.pdf', path: '/tmp/multer/report.pdf' };
+  const outputFilePath = path.join(outputPath, 'file-123.pdf');
+
+  beforeEach(() => {
+    jest.spyOn(fs.promises, 'mkdir').mockResolvedValue(undefined);
+    jest.spyOn(fs.promises, 'rename').mockResolvedValue(undefined);
+    jest.spyOn(fs.promises, 'copyFile').mockResolvedValue(undefined);
+    jest.spyOn(fs.promises, 'unlink').mockResolvedValue(undefined);
+  });
+
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  it('should rename the uploaded file into place', async () => {
+    await expect(saveLocalFile(file, outputPath, 'file-123')).resolves.toBe(outputFilePath);
+
+    expect(fs.promises.mkdir).toHaveBeenCalledWith(outputPath, { recursive: true });
+    expect(fs.promises.rename).toHaveBeenCalledWith(file.path, outputFilePath);
+    expect(fs.promises.copyFile).not.toHaveBeenCalled();
+    expect(fs.promises.unlink).not.toHaveBeenCalled();
+  });
+
+  it('should copy then unlink when the rename crosses devices', async () => {
+    fs.promises.rename.mockRejectedValue(Object.assign(new Error('EXDEV'), { code: 'EXDEV' }));
+
+    await expect(saveLocalFile(file, outputPath, 'file-123')).resolves.toBe(outputFilePath);
+
+    expect(fs.promises.copyFile).toHaveBeenCalledWith(file.path, outputFilePath);
+    expect(fs.promises.unlink).toHaveBeenCalledWith(file.path);
+    expect(fs.promises.copyFile.mock.invocationCallOrder[0]).toBeLessThan(
+      fs.promises.unlink.mock.invocationCallOrder[0],
+    );
+  });
+
+  it('should rethrow rename errors other than EXDEV', async () => {
+    const error = Object.assign(new Error('EACCES'), { code: 'EACCES' });
+    fs.promises.rename.mockRejectedValue(error);
+
+    await expect(saveLocalFile(file, outputPath, 'file-123')).rejects.toBe(error);
+
+    expect(fs.promises.copyFile).not.toHaveBeenCalled();
+    expect(fs.promises.unlink).not.toHaveBeenCalled();
+  });
+});
@@ -41,9 +41,7 @@ async function uploadLocalImage({ req, file, file_id, endpoint, resolution = 'hi
   const { imageOutput } = appConfig.paths;
   const userPath = path.join(imageOutput, req.user.id);
 
-  if (!fs.existsSync(userPath)) {
-    fs.mkdirSync(userPath, { recursive: true });
-  }
+  await fs.promises.mkdir(userPath, { recursive: true });
 
   const fileName = `${file_id}__${path.basename(inputFilePath)}`;
   const newPath = path.join(userPath, fileName);
@@ -94,9 +92,7 @@ async function prepareImagesLocal(req, file) {
   const { publicPath, imageOutput } = appConfig.paths;
   const userPath = path.join(imageOutput, req.user.id);
 
-  if (!fs.existsSync(userPath)) {
-    fs.mkdirSync(userPath, { recursive: true });
-  }
+  await fs.promises.mkdir(userPath, { recursive: true });
   const filepath = path.join(publicPath, file.filepath);
 
   const promises = [];
@@ -282,6 +282,9 @@ async function getS3FileStream(_req, filePath) {
   }
 }
 
+/** Fixed-width AWS date format (YYYYMMDDTHHMMSSZ) used by `X-Amz-Date` */
+const AMZ_DATE_PATTERN = /^(\d{4})(\d{2})(\d{2})T(\d{2})(\d{2})(\d{2})Z$/;
+
 /**
  * Determines if a signed S3 URL is close to expiration
  *
@@ -310,30 +313,35 @@ function needsRefresh(signedUrl, bufferSeconds) {
       return true;
     }
 
-    // Parse the AWS date format (YYYYMMDDTHHMMSSZ)
-    const year = dateParam.substring(0, 4);
-    const month = dateParam.substring(4, 6);
-    const day = dateParam.substring(6, 8);
-    const hour = dateParam.substring(9, 11);
-    const minute = dateParam.substring(11, 13);
-    const second = dateParam.substring(13, 15);
+    const dateMatch = AMZ_DATE_PATTERN.exec(dateParam);
+    if (!dateMatch) {
+      // Malformed date, so the expiration is unknown; leave the URL as-is
+      return false;
+    }
 
-    const dateObj = new Date(`${year}-${month}-${day}T${hour}:${minute}:${second}Z`);
-    const expiresAtDate = new Date(dateObj.getTime() + parseInt(expiresParam) * 1000);
+    // Convert the date fields directly into epoch milliseconds
+    const [, year, month, day, hour, minute, second] = dateMatch;
+    const createdAtMs = Date.UTC(
+      Number(year),
+      Number(month) - 1,
+      Number(day),
+      Number(hour),
+      Number(minute),
+      Number(second),
+    );
+    const expiresAtMs = createdAtMs + parseInt(expiresParam) * 1000;
 
     // Check if it's close to expiration
-    const now = new Date();
+    const nowMs = Date.now();
 
     // If S3_REFRESH_EXPIRY_MS is set, use it to determine if URL is expired
     if (s3RefreshExpiryMs !== null) {
-      const urlCreationTime = dateObj.getTime();
-      const urlAge = now.getTime() - urlCreationTime;
+      const urlAge = nowMs - createdAtMs;
       return urlAge >= s3RefreshExpiryMs;
     }
 
     // Otherwise use the default buffer-based logic
-    const bufferTime = new Date(now.getTime() + bufferSeconds * 1000);
-    return expiresAtDate <= bufferTime;
+    return expiresAtMs <= nowMs + bufferSeconds * 1000;
   } catch (error) {
     logger.error('Error checking URL expiration:', error);
     // If we can't determine, assume it needs refresh to be safe
@@ -384,7 +392,8 @@ async function refreshS3FileUrls(files, batchUpdateFiles, bufferSeconds = 3600)
     return files;
   }
 
-  const filesToUpdate = [];
+  /** @type {Promise<{ file_id: string, filepath: string } | undefined>[]} */
+  const refreshPromises = [];
 
   for (let i = 0; i < files.length; i++) {
     const file = files[i];
@@ -400,21 +409,28 @@ async function refreshS3FileUrls(files, batchUpdateFiles, bufferSeconds = 3600)
     if (!needsRefresh(file.filepath, bufferSeconds)) {
       continue;
     }
-    try {
-      const newURL = await getNewS3URL(file.filepath);
-      if (!newURL) {
-        continue;
-      }
-      filesToUpdate.push({
-        file_id: file.file_id,
-        filepath: newURL,
-      });
-      files[i].filepath = newURL;
-    } catch (error) {
-      logger.error(`Error refreshing S3 URL for file ${file.file_id}:`, error);
-    }
+    refreshPromises.push(
+      (async () => {
+        try {
+          const newURL = await getNewS3URL(file.filepath);
+          if (!newURL) {
+            return;
+          }
+          files[i].filepath = newURL;
+          return {
+            file_id: file.file_id,
+            filepath: newURL,
+          };
+        } catch (error) {
+          logger.error(`Error refreshing S3 URL for file ${file.file_id}:`, error);
+        }
+      })(),
+    );
   }
 
+  /** URLs are signed independently, so generate them concurrently */
+  const filesToUpdate = (await Promise.all(refreshPromises)).filter(Boolean);
+
   if (filesToUpdate.length > 0) {
     await batchUpdateFiles(filesToUpdate);
   }
@@ -919,7 +919,8 @@ function base64ToBuffer(base64String) {
     const typeMatch = base64String.match(/^data:([A-Za-z-+/]+);base64,/);
     const type = typeMatch ? typeMatch[1] : '';
 
-    const base64Data = base64String.replace(/^data:([A-Za-z-+/]+);base64,/, '');
+    /** Slice past the matched prefix rather than re-scanning and copying the whole payload */
+    const base64Data = typeMatch ? base64String.slice(typeMatch[0].length) : base64String;
 
     if (!base64Data) {
       throw new Error('Invalid base64 string');
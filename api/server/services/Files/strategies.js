@@ -246,37 +246,49 @@ const vertexMistralOCRStrategy = () => ({
   handleFileUpload: uploadGoogleVertexMistralOCR,
 });
 
+/**
+ * Strategy Selector lookup table
+ * @type {Map<FileSources, () => ReturnType<typeof localStrategy>>}
+ */
+const strategyFactories = new Map([
+  [FileSources.firebase, firebaseStrategy],
+  [FileSources.local, localStrategy],
+  [FileSources.openai, openAIStrategy],
+  [FileSources.azure, openAIStrategy],
+  [FileSources.azure_blob, azureStrategy],
+  [FileSources.vectordb, vectorStrategy],
+  [FileSources.s3, s3Strategy],
+  [FileSources.execute_code, codeOutputStrategy],
+  [FileSources.mistral_ocr, mistralOCRStrategy],
+  [FileSources.azure_mistral_ocr, azureMistralOCRStrategy],
+  [FileSources.vertexai_mistral_ocr, vertexMistralOCRStrategy],
+  [FileSources.text, localStrategy], // Text files use local strategy
+]);
+
+/**
+ * Built strategies by file source; each strategy only holds function references,
+ * so one frozen instance per source is shared by all callers
+ * @type {Map<FileSources, ReturnType<typeof localStrategy>>}
+ */
+const strategyCache = new Map();
+
 // Strategy Selector
 const getStrategyFunctions = (fileSource) => {
-  if (fileSource === FileSources.firebase) {
-    return firebaseStrategy();
-  } else if (fileSource === FileSources.local) {
-    return localStrategy();
-  } else if (fileSource === FileSources.openai) {
-    return openAIStrategy();
-  } else if (fileSource === FileSources.azure) {
-    return openAIStrategy();
-  } else if (fileSource === FileSources.azure_blob) {
-    return azureStrategy();
-  } else if (fileSource === FileSources.vectordb) {
-    return vectorStrategy();
-  } else if (fileSource === FileSources.s3) {
-    return s3Strategy();
-  } else if (fileSource === FileSources.execute_code) {
-    return codeOutputStrategy();
-  } else if (fileSource === FileSources.mistral_ocr) {
-    return mistralOCRStrategy();
-  } else if (fileSource === FileSources.azure_mistral_ocr) {
-    return azureMistralOCRStrategy();
-  } else if (fileSource === FileSources.vertexai_mistral_ocr) {
-    return vertexMistralOCRStrategy();
-  } else if (fileSource === FileSources.text) {
-    return localStrategy(); // Text files use local strategy
-  } else {
+  const cachedStrategy = strategyCache.get(fileSource);
+  if (cachedStrategy) {
+    return cachedStrategy;
+  }
+
+  const createStrategy = strategyFactories.get(fileSource);
+  if (!createStrategy) {
     throw new Error(
       `Invalid file source: ${fileSource}. Available sources: ${Object.values(FileSources).join(', ')}`,
     );
   }
+
+  const strategy = Object.freeze(createStrategy());
+  strategyCache.set(fileSource, strategy);
+  return strategy;
 };
 
 module.exports = {
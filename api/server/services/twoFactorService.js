@@ -1,4 +1,4 @@
-const { webcrypto } = require('node:crypto');
+const { webcrypto, timingSafeEqual } = require('node:crypto');
 const { hashBackupCode, decryptV3, decryptV2 } = require('@librechat/api');
 const { updateUser } = require('~/models');
 
@@ -64,32 +64,39 @@ const generateTOTPSecret = () => {
 };
 
 /**
- * Generates a TOTP code based on the secret and time.
- * Uses a 30-second time step and produces a 6-digit code.
+ * Imports a Base32 TOTP secret as an HMAC-SHA1 signing key.
  * @param {string} secret
- * @param {number} [forTime=Date.now()]
- * @returns {Promise<string>}
+ * @returns {Promise<CryptoKey>}
  */
-const generateTOTP = async (secret, forTime = Date.now()) => {
-  const timeStep = 30; // seconds
-  const counter = Math.floor(forTime / 1000 / timeStep);
-  const counterBuffer = new ArrayBuffer(8);
-  const counterView = new DataView(counterBuffer);
-  counterView.setUint32(4, counter, false);
-
+const importTOTPKey = async (secret) => {
   const keyBuffer = decodeBase32(secret);
   const keyArrayBuffer = keyBuffer.buffer.slice(
     keyBuffer.byteOffset,
     keyBuffer.byteOffset + keyBuffer.byteLength,
   );
 
-  const cryptoKey = await webcrypto.subtle.importKey(
+  return await webcrypto.subtle.importKey(
     'raw',
     keyArrayBuffer,
     { name: 'HMAC', hash: 'SHA-1' },
     false,
     ['sign'],
   );
+};
+
+/**
+ * Computes the TOTP code for an imported key and time.
+ * @param {CryptoKey} cryptoKey
+ * @param {number} forTime
+ * @returns {Promise<string>}
+ */
+const computeTOTP = async (cryptoKey, forTime) => {
+  const timeStep = 30; // seconds
+  const counter = Math.floor(forTime / 1000 / timeStep);
+  const counterBuffer = new ArrayBuffer(8);
+  const counterView = new DataView(counterBuffer);
+  counterView.setUint32(4, counter, false);
+
   const signatureBuffer = await webcrypto.subtle.sign('HMAC', cryptoKey, counterBuffer);
   const hmac = new Uint8Array(signatureBuffer);
 
@@ -102,18 +109,36 @@ const generateTOTP = async (secret, forTime = Date.now()) => {
   return code;
 };
 
+/**
+ * Generates a TOTP code based on the secret and time.
+ * Uses a 30-second time step and produces a 6-digit code.
+ * @param {string} secret
+ * @param {number} [forTime=Date.now()]
+ * @returns {Promise<string>}
+ */
+const generateTOTP = async (secret, forTime = Date.now()) => {
+  const cryptoKey = await importTOTPKey(secret);
+  return await computeTOTP(cryptoKey, forTime);
+};
+
 /**
  * Verifies a TOTP token by checking a ±1 time step window.
+ * The secret is imported once for the whole window and codes are compared in constant time.
  * @param {string} secret
  * @param {string} token
  * @returns {Promise<boolean>}
  */
 const verifyTOTP = async (secret, token) => {
+  if (typeof token !== 'string') {
+    return false;
+  }
+  const tokenBuffer = Buffer.from(token);
+  const cryptoKey = await importTOTPKey(secret);
   const timeStepMS = 30 * 1000;
   const currentTime = Date.now();
   for (let offset = -1; offset <= 1; offset++) {
-    const expected = await generateTOTP(secret, currentTime + offset * timeStepMS);
-    if (expected === token) {
+    const expected = Buffer.from(await computeTOTP(cryptoKey, currentTime + offset * timeStepMS));
+    if (expected.length === tokenBuffer.length && timingSafeEqual(expected, tokenBuffer)) {
       return true;
     }
   }
@@ -0,0 +1,72 @@
+jest.mock('@librechat/api', () => ({
+  hashBackupCode: jest.fn(),
+  decryptV3: jest.fn(),
+  decryptV2: jest.fn(),
+}));
+
+jest.mock('~/models', () => ({
+  updateUser: jest.fn(),
+}));
+
+const { generateTOTP, verifyTOTP } = require('./twoFactorService');
+
+/** Base32 encoding of the RFC 6238 SHA-1 test secret "12345678901234567890" */
+const RFC_SECRET = 'GEZDGNBVGY3TQOJQGEZDGNBVGY3TQOJQ';
+const TIME_STEP_MS = 30 * 1000;
+
+describe('twoFactorService', () => {
+  describe('generateTOTP', () => {
+    it.each([
+      [59, '287082'],
+      [1111111109, '081804'],
+      [1234567890, '005924'],
+      [2000000000, '279037'],
+    ])('should match the RFC 6238 vector at T=%i', async (seconds, expected) => {
+      await expect(generateTOTP(RFC_SECRET, seconds * 1000)).resolves.toBe(expected);
+    });
+  });
+
+  describe('verifyTOTP', () => {
+    const now = 1111111109 * 1000;
+
+    beforeEach(() => {
+      jest.spyOn(Date, 'now').mockReturnValue(now);
+    });
+
+    afterEach(() => {
+      jest.restoreAllMocks();
+    });
+
+    it.each([
+      ['previous', -TIME_STEP_MS],
+      ['current', 0],
+      ['next', TIME_STEP_MS],
+    ])('should accept the code for the %s time step', async (_label, offset) => {
+      const token = await generateTOTP(RFC_SECRET, now + offset);
+      await expect(verifyTOTP(RFC_SECRET, token)).resolves.toBe(true);
+    });
+
+    it('should reject a code outside the ±1 step window', async () => {
+      const token = await generateTOTP(RFC_SECRET, now + 2 * TIME_STEP_MS);
+      await expect(verifyTOTP(RFC_SECRET, token)).resolves.toBe(false);
+    });
+
+    it('should reject a wrong token', async () => {
+      const token = await generateTOTP(RFC_SECRET, now);
+      const wrongToken = token.replace(/^./, (digit) => String((Number(digit) + 1) % 10));
+      await expect(verifyTOTP(RFC_SECRET, wrongToken)).resolves.toBe(false);
+    });
+
+    it('should reject a token of the wrong length', async () => {
+      const token = await generateTOTP(RFC_SECRET, now);
+      await expect(verifyTOTP(RFC_SECRET, token.slice(1))).resolves.toBe(false);
+      await expect(verifyTOTP(RFC_SECRET, `${token}0`)).resolves.toBe(false);
+    });
+
+    it('should reject a non-string token', async () => {
+      const token = await generateTOTP(RFC_SECRET, now);
+      await expect(verifyTOTP(RFC_SECRET, Number(token))).resolves.toBe(false);
+      await expect(verifyTOTP(RFC_SECRET, undefined)).resolves.toBe(false);
+    });
+  });
+});
@@ -1,4 +1,9 @@
-const { getS3URL } = require('../../../../../server/services/Files/S3/crud');
+const { FileSources } = require('librechat-data-provider');
+const {
+  getS3URL,
+  needsRefresh,
+  refreshS3FileUrls,
+} = require('../../../../../server/services/Files/S3/crud');
 
 // Mock AWS SDK
 jest.mock('@aws-sdk/client-s3', () => ({
@@ -70,3 +75,201 @@ describe('S3 crud.js - test only new parameter changes', () => {
     expect(result).toBe('https://test-presigned-url.com');
   });
 });
+
+describe('S3 crud.js - needsRefresh', () => {
+  const NOW = Date.UTC(2024, 0, 1, 12, 0, 0);
+  const BUFFER_SECONDS = 60;
+
+  /** Formats epoch milliseconds as an `X-Amz-Date` value (YYYYMMDDTHHMMSSZ) */
+  const toAmzDate = (ms) =>
+    new Date(ms)
+      .toISOString()
+      .replace(/[-:]/g, '')
+      .replace(/\.\d{3}/, '');
+
+  const createSignedUrl = ({ date, expires = 3600 }) =>
+    `https://test-bucket.s3.amazonaws.com/images/user123/file.png?X-Amz-Date=${date}&X-Amz-Expires=${expires}&X-Amz-Signature=signature`;
+
+  beforeEach(() => {
+    jest.spyOn(Date, 'now').mockReturnValue(NOW);
+  });
+
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  it('should not refresh URLs without a signature', () => {
+    const url = 'https://test-bucket.s3.amazonaws.com/images/user123/file.png';
+    expect(needsRefresh(url, BUFFER_SECONDS)).toBe(false);
+  });
+
+  it('should refresh signed URLs missing expiration parameters', () => {
+    const url =
+      'https://test-bucket.s3.amazonaws.com/images/user123/file.png?X-Amz-Signature=signature';
+    expect(needsRefresh(url, BUFFER_SECONDS)).toBe(true);
+  });
+
+  it('should not refresh URLs that expire after the buffer', () => {
+    const url = createSignedUrl({ date: toAmzDate(NOW) });
+    expect(needsRefresh(url, BUFFER_SECONDS)).toBe(false);
+  });
+
+  it('should refresh URLs that expire within the buffer', () => {
+    const url = createSignedUrl({ date: toAmzDate(NOW - 3590 * 1000) });
+    expect(needsRefresh(url, BUFFER_SECONDS)).toBe(true);
+  });
+
+  it('should refresh expired URLs', () => {
+    const url = createSignedUrl({ date: toAmzDate(NOW - 2 * 3600 * 1000) });
+    expect(needsRefresh(url, BUFFER_SECONDS)).toBe(true);
+  });
+
+  it.each(['20240101', '20240101T1200', 'not-a-date', '2024-01-01T12:00:00Z'])(
+    'should not refresh URLs with a malformed X-Amz-Date (%s)',
+    (date) => {
+      expect(needsRefresh(createSignedUrl({ date }), BUFFER_SECONDS)).toBe(false);
+    },
+  );
+
+  describe('with S3_REFRESH_EXPIRY_MS', () => {
+    const originalRefreshExpiry = process.env.S3_REFRESH_EXPIRY_MS;
+    let isolatedNeedsRefresh;
+
+    beforeEach(() => {
+      process.env.S3_REFRESH_EXPIRY_MS = String(60 * 1000);
+      jest.isolateModules(() => {
+        isolatedNeedsRefresh = require('../../../../../server/services/Files/S3/crud').needsRefresh;
+      });
+    });
+
+    afterEach(() => {
+      if (originalRefreshExpiry === undefined) {
+        delete process.env.S3_REFRESH_EXPIRY_MS;
+      } else {
+        process.env.S3_REFRESH_EXPIRY_MS = originalRefreshExpiry;
+      }
+    });
+
+    it('should refresh URLs older than the configured age', () => {
+      const url = createSignedUrl({ date: toAmzDate(NOW - 2 * 60 * 1000) });
+      expect(isolatedNeedsRefresh(url, BUFFER_SECONDS)).toBe(true);
+    });
+
+    it('should not refresh URLs younger than the configured age', () => {
+      const url = createSignedUrl({ date: toAmzDate(NOW - 30 * 1000) });
+      expect(isolatedNeedsRefresh(url, BUFFER_SECONDS)).toBe(false);
+    });
+  });
+});
+
+describe('S3 crud.js - refreshS3FileUrls', () => {
+  /** Signed long before the test run, so these URLs always need refreshing */
+  const createExpiredUrl = (key) =>
+    `https://test-bucket.s3.amazonaws.com/${key}?X-Amz-Date=20200101T000000Z&X-Amz-Expires=120&X-Amz-Signature=signature`;
+
+  const createFile = (file_id, key = `images/user123/${file_id}`) => ({
+    file_id,
+    source: FileSources.s3,
+    filepath: createExpiredUrl(key),
+  });
+
+  /** The S3 key a mocked `GetObjectCommand` instance was constructed with */
+  const getCommandKey = (command) =>
+    GetObjectCommand.mock.calls[GetObjectCommand.mock.instances.indexOf(command)][0].Key;
+
+  /**
+   * Signs each key as `https://new-url.com/<key>`, resolving after `delays[key]` ms so
+   * signatures can complete out of order; keys in `failures` reject instead
+   */
+  const mockSignedUrls = ({ delays = {}, failures = [] } = {}) => {
+    getSignedUrl.mockImplementation((_s3, command) => {
+      const key = getCommandKey(command);
+      return new Promise((resolve, reject) =>
+        setTimeout(() => {
+          if (failures.includes(key)) {
+            reject(new Error(`Signing failed for ${key}`));
+            return;
+          }
+          resolve(`https://new-url.com/${key}`);
+        }, delays[key] ?? 0),
+      );
+    });
+  };
+
+  beforeEach(() => {
+    jest.clearAllMocks();
+    process.env.AWS_BUCKET_NAME = 'test-bucket';
+  });
+
+  it('should refresh every expired file and update them in one batch, in input order', async () => {
+    mockSignedUrls({ delays: { 'images/user123/file-1': 30, 'images/user123/file-2': 10 } });
+    const batchUpdateFiles = jest.fn().mockResolvedValue();
+    const files = [createFile('file-1'), createFile('file-2'), createFile('file-3')];
+
+    const result = await refreshS3FileUrls(files, batchUpdateFiles);
+
+    expect(result).toBe(files);
+    expect(files.map(({ filepath }) => filepath)).toEqual([
+      'https://new-url.com/images/user123/file-1',
+      'https://new-url.com/images/user123/file-2',
+      'https://new-url.com/images/user123/file-3',
+    ]);
+    expect(batchUpdateFiles).toHaveBeenCalledTimes(1);
+    expect(batchUpdateFiles).toHaveBeenCalledWith([
+      { file_id: 'file-1', filepath: 'https://new-url.com/images/user123/file-1' },
+      { file_id: 'file-2', filepath: 'https://new-url.com/images/user123/file-2' },
+      { file_id: 'file-3', filepath: 'https://new-url.com/images/user123/file-3' },
+    ]);
+  });
+
+  it('should still refresh the other files when one refresh fails', async () => {
+    mockSignedUrls({ failures: ['images/user123/file-2'] });
+    const batchUpdateFiles = jest.fn().mockResolvedValue();
+    const files = [createFile('file-1'), createFile('file-2'), createFile('file-3')];
+    const originalFailedPath = files[1].filepath;
+
+    await refreshS3FileUrls(files, batchUpdateFiles);
+
+    expect(files[1].filepath).toBe(originalFailedPath);
+    expect(batchUpdateFiles).toHaveBeenCalledTimes(1);
+    expect(batchUpdateFiles).toHaveBeenCalledWith([
+      { file_id: 'file-1', filepath: 'https://new-url.com/images/user123/file-1' },
+      { file_id: 'file-3', filepath: 'https://new-url.com/images/user123/file-3' },
+    ]);
+  });
+
+  it('should skip files for which no new URL is generated', async () => {
+    mockSignedUrls();
+    const batchUpdateFiles = jest.fn().mockResolvedValue();
+    /** A key without a base path and user ID cannot be re-signed */
+    const unsignable = createFile('file-2', 'file-2');
+    const files = [createFile('file-1'), unsignable];
+    const originalUnsignablePath = unsignable.filepath;
+
+    await refreshS3FileUrls(files, batchUpdateFiles);
+
+    expect(unsignable.filepath).toBe(originalUnsignablePath);
+    expect(batchUpdateFiles).toHaveBeenCalledTimes(1);
+    expect(batchUpdateFiles).toHaveBeenCalledWith([
+      { file_id: 'file-1', filepath: 'https://new-url.com/images/user123/file-1' },
+    ]);
+  });
+
+  it('should skip non-S3 and unsigned files without a batch update', async () => {
+    mockSignedUrls();
+    const batchUpdateFiles = jest.fn().mockResolvedValue();
+    const files = [
+      { ...createFile('file-1'), source: FileSources.local },
+      {
+        file_id: 'file-2',
+        source: FileSources.s3,
+        filepath: 'https://test-bucket.s3.amazonaws.com/images/user123/file-2',
+      },
+    ];
+
+    await refreshS3FileUrls(files, batchUpdateFiles);
+
+    expect(getSignedUrl).not.toHaveBeenCalled();
+    expect(batchUpdateFiles).not.toHaveBeenCalled();
+  });
+});
@@ -31,6 +31,12 @@ const refTypeMap: Record<string | SearchRefType, string> = {
   file: 'references',
 };
 
+/** Lowercases the ref type once and resolves the `searchResults` key it maps to */
+function resolveRefType(refType: SearchRefType | string): { key: string; normalized: string } {
+  const normalized = refType.toLowerCase();
+  return { key: refTypeMap[normalized] ?? refType, normalized };
+}
+
 export function useCitation({
   turn,
   index,
@@ -44,9 +50,7 @@ export function useCitation({
   if (!_refType) {
     return undefined;
   }
-  const refType = refTypeMap[_refType.toLowerCase()]
-    ? refTypeMap[_refType.toLowerCase()]
-    : _refType;
+  const { key: refType, normalized } = resolveRefType(_refType);
 
   if (!searchResults || !searchResults[turn] || !searchResults[turn][refType]) {
     return undefined;
@@ -61,7 +65,7 @@ export function useCitation({
   return {
     ...source,
     turn,
-    refType: _refType.toLowerCase(),
+    refType: normalized,
     index,
     link: source.link ?? '',
     title: source.title ?? '',
@@ -78,9 +82,7 @@ export function useCompositeCitations(
   const result: Array<t.Citation & t.Reference> = [];
 
   for (const { turn, refType: _refType, index } of citations) {
-    const refType = refTypeMap[_refType.toLowerCase()]
-      ? refTypeMap[_refType.toLowerCase()]
-      : _refType;
+    const { key: refType, normalized } = resolveRefType(_refType);
 
     if (!searchResults || !searchResults[turn] || !searchResults[turn][refType]) {
       continue;
@@ -93,7 +95,7 @@ export function useCompositeCitations(
     result.push({
       ...source,
       turn,
-      refType: _refType.toLowerCase(),
+      refType: normalized,
       index,
       link: source.link ?? '',
       title: source.title ?? '',
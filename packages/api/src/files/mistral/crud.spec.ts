@@ -36,6 +36,7 @@ jest.mock('axios', () => {
 
 jest.mock('@librechat/data-schemas', () => ({
   logger: {
+    debug: jest.fn(),
     error: jest.fn(),
   },
 }));
@@ -49,8 +50,13 @@ jest.mock('~/utils/files', () => ({
   readFileAsBuffer: jest.fn(),
 }));
 
+jest.mock('~/utils/key', () => ({
+  loadServiceKey: jest.fn(),
+}));
+
 import * as fs from 'fs';
 import axios from 'axios';
+import { generateKeyPairSync } from 'crypto';
 import { HttpsProxyAgent } from 'https-proxy-agent';
 import type { Readable } from 'stream';
 import type {
@@ -61,6 +67,7 @@ import type {
 } from '~/types';
 import { logger as mockLogger } from '@librechat/data-schemas';
 import { readFileAsBuffer } from '~/utils/files';
+import { loadServiceKey } from '~/utils/key';
 import {
   uploadDocumentToMistral,
   uploadAzureMistralOCR,
@@ -68,7 +75,9 @@ import {
   uploadMistralOCR,
   getSignedUrl,
   performOCR,
+  uploadGoogleVertexMistralOCR,
 } from './crud';
+import { mistralOCRState } from './state';
 
 interface MockReadStream extends Partial<Readable> {
   on: jest.Mock;
@@ -95,6 +104,9 @@ const mockLoadAuthValues = jest.fn();
 describe('MistralOCR Service', () => {
   afterEach(() => {
     jest.clearAllMocks();
+    delete mistralOCRState.proxyAgent;
+    delete mistralOCRState.googleAuth;
+    delete mistralOCRState.pendingGoogleAuth;
   });
 
   describe('uploadDocumentToMistral', () => {
@@ -1873,6 +1885,50 @@ describe('MistralOCR Service', () => {
         );
       });
 
+      it('should reuse one keep-alive proxy agent across sequential OCR calls', async () => {
+        process.env.PROXY = 'http://proxy.example.com:8080';
+
+        mockAxios.post!.mockResolvedValueOnce({
+          data: {
+            id: 'file-shared-agent-123',
+            object: 'file',
+            bytes: 1024,
+            created_at: Date.now(),
+            filename: 'test.pdf',
+            purpose: 'ocr',
+          },
+        });
+        mockAxios.get!.mockResolvedValueOnce({
+          data: { url: 'https://signed-url.com', expires_at: Date.now() + 86400000 },
+        });
+        mockAxios.post!.mockResolvedValueOnce({
+          data: {
+            model: 'mistral-ocr-latest',
+            pages: [],
+            document_annotation: '',
+            usage_info: { pages_processed: 0, doc_size_bytes: 1024 },
+          },
+        });
+
+        await uploadDocumentToMistral({
+          filePath: '/path/to/test.pdf',
+          fileName: 'test.pdf',
+          apiKey: 'test-api-key',
+        });
+        await getSignedUrl({ fileId: 'file-shared-agent-123', apiKey: 'test-api-key' });
+        await performOCR({ apiKey: 'test-api-key', url: 'https://signed-url.com' });
+
+        expect(HttpsProxyAgent).toHaveBeenCalledTimes(1);
+        expect(HttpsProxyAgent).toHaveBeenCalledWith('http://proxy.example.com:8080', {
+          keepAlive: true,
+        });
+
+        const uploadAgent = mockAxios.post!.mock.calls[0][2]?.httpsAgent;
+        expect(uploadAgent).toBeDefined();
+        expect(mockAxios.get!.mock.calls[0][1]?.httpsAgent).toBe(uploadAgent);
+        expect(mockAxios.post!.mock.calls[1][2]?.httpsAgent).toBe(uploadAgent);
+      });
+
       it('should not use proxy when PROXY env var is not set', async () => {
         delete process.env.PROXY;
 
@@ -2338,4 +2394,235 @@ describe('MistralOCR Service', () => {
       });
     });
   });
+
+  describe('uploadGoogleVertexMistralOCR', () => {
+    const TOKEN_URL = 'https://oauth2.googleapis.com/token';
+    const originalKeyFile = process.env.GOOGLE_SERVICE_KEY_FILE;
+    const { privateKey } = generateKeyPairSync('rsa', {
+      modulusLength: 2048,
+      privateKeyEncoding: { type: 'pkcs8', format: 'pem' },
+      publicKeyEncoding: { type: 'spki', format: 'pem' },
+    });
+
+    let tokenCount: number;
+
+    const createServiceKey = (project_id = 'vertex-project') => ({
+      client_email: `ocr@${project_id}.iam.gserviceaccount.com`,
+      private_key: privateKey,
+      project_id,
+    });
+
+    const mockVertexResponses = (tokenData: { expires_in?: number } = { expires_in: 3600 }) => {
+      mockAxios.post!.mockImplementation((url: string) => {
+        if (url === TOKEN_URL) {
+          tokenCount += 1;
+          return Promise.resolve({
+            data: { access_token: `access-token-${tokenCount}`, ...tokenData },
+          });
+        }
+        return Promise.resolve({
+          data: {
+            model: 'mistral-ocr-2505',
+            pages: [
+              {
+                index: 0,
+                markdown: 'Vertex OCR content',
+                images: [],
+                dimensions: { dpi: 300, height: 1100, width: 850 },
+              },
+            ],
+            document_annotation: '',
+            usage_info: { pages_processed: 1, doc_size_bytes: 1024 },
+          } as OCRResult,
+        });
+      });
+    };
+
+    const runVertexOCR = () =>
+      uploadGoogleVertexMistralOCR({
+        req: { user: { id: 'user123' }, config: {} } as unknown as ServerRequest,
+        file: {
+          path: '/tmp/upload/vertex-file.pdf',
+          originalname: 'vertex-document.pdf',
+          mimetype: 'application/pdf',
+          size: 1024,
+        } as Express.Multer.File,
+        loadAuthValues: mockLoadAuthValues,
+      });
+
+    const getTokenCalls = () => mockAxios.post!.mock.calls.filter(([url]) => url === TOKEN_URL);
+
+    const getOCRCalls = () => mockAxios.post!.mock.calls.filter(([url]) => url !== TOKEN_URL);
+
+    beforeEach(() => {
+      tokenCount = 0;
+      process.env.GOOGLE_SERVICE_KEY_FILE = '/secrets/vertex-key.json';
+      (readFileAsBuffer as jest.Mock).mockResolvedValue({
+        content: Buffer.from('mock-file-content'),
+        bytes: Buffer.from('mock-file-content').length,
+      });
+      (loadServiceKey as jest.Mock).mockResolvedValue(createServiceKey());
+      mockVertexResponses();
+    });
+
+    afterEach(() => {
+      if (originalKeyFile) {
+        process.env.GOOGLE_SERVICE_KEY_FILE = originalKeyFile;
+      } else {
+        delete process.env.GOOGLE_SERVICE_KEY_FILE;
+      }
+    });
+
+    describe('service account caching', () => {
+      it('should reuse the loaded service account while the access token is valid', async () => {
+        await runVertexOCR();
+        await runVertexOCR();
+
+        expect(loadServiceKey).toHaveBeenCalledTimes(1);
+        expect(loadServiceKey).toHaveBeenCalledWith('/secrets/vertex-key.json');
+        expect(getOCRCalls()).toHaveLength(2);
+      });
+
+      it('should retry loading the service account after a failed load', async () => {
+        (loadServiceKey as jest.Mock).mockResolvedValueOnce(null);
+
+        await expect(runVertexOCR()).rejects.toThrow();
+        expect(getTokenCalls()).toHaveLength(0);
+
+        await expect(runVertexOCR()).resolves.toEqual(
+          expect.objectContaining({ text: expect.stringContaining('Vertex OCR content') }),
+        );
+        expect(loadServiceKey).toHaveBeenCalledTimes(2);
+      });
+
+      it('should re-resolve a rotated service key when the token is refreshed', async () => {
+        const now = Date.now();
+        const dateSpy = jest.spyOn(Date, 'now').mockReturnValue(now);
+
+        await runVertexOCR();
+
+        (loadServiceKey as jest.Mock).mockResolvedValue(createServiceKey('rotated-project'));
+        dateSpy.mockReturnValue(now + 3600 * 1000);
+
+        await runVertexOCR();
+
+        expect(loadServiceKey).toHaveBeenCalledTimes(2);
+        const [firstOCRCall, secondOCRCall] = getOCRCalls();
+        expect(firstOCRCall[0]).toContain('/projects/vertex-project/');
+        expect(secondOCRCall[0]).toContain('/projects/rotated-project/');
+      });
+    });
+
+    describe('access token caching', () => {
+      const REFRESH_AT_MS = (3600 - 5 * 60) * 1000;
+
+      const getAuthorizationHeaders = () =>
+        getOCRCalls().map(([, , config]) => config?.headers?.Authorization);
+
+      it('should reuse the access token within its lifetime', async () => {
+        await runVertexOCR();
+        await runVertexOCR();
+        await runVertexOCR();
+
+        expect(getTokenCalls()).toHaveLength(1);
+        expect(getAuthorizationHeaders()).toEqual([
+          'Bearer access-token-1',
+          'Bearer access-token-1',
+          'Bearer access-token-1',
+        ]);
+      });
+
+      it('should exchange a new JWT once the refresh margin is reached', async () => {
+        const now = Date.now();
+        const dateSpy = jest.spyOn(Date, 'now').mockReturnValue(now);
+
+        await runVertexOCR();
+
+        dateSpy.mockReturnValue(now + REFRESH_AT_MS - 1);
+        await runVertexOCR();
+        expect(getTokenCalls()).toHaveLength(1);
+
+        dateSpy.mockReturnValue(now + REFRESH_AT_MS);
+        await runVertexOCR();
+
+        expect(getTokenCalls()).toHaveLength(2);
+        expect(getAuthorizationHeaders()).toEqual([
+          'Bearer access-token-1',
+          'Bearer access-token-1',
+          'Bearer access-token-2',
+        ]);
+      });
+
+      it('should assume a one hour lifetime when expires_in is missing', async () => {
+        mockVertexResponses({});
+        const now = Date.now();
+        const dateSpy = jest.spyOn(Date, 'now').mockReturnValue(now);
+
+        await runVertexOCR();
+
+        dateSpy.mockReturnValue(now + REFRESH_AT_MS - 1);
+        await runVertexOCR();
+        expect(getTokenCalls()).toHaveLength(1);
+
+        dateSpy.mockReturnValue(now + REFRESH_AT_MS);
+        await runVertexOCR();
+        expect(getTokenCalls()).toHaveLength(2);
+      });
+
+      it('should share one in-flight refresh between concurrent uploads', async () => {
+        await Promise.all([runVertexOCR(), runVertexOCR(), runVertexOCR()]);
+
+        expect(loadServiceKey).toHaveBeenCalledTimes(1);
+        expect(getTokenCalls()).toHaveLength(1);
+        expect(getOCRCalls()).toHaveLength(3);
+      });
+
+      it('should clear a failed in-flight refresh so the next upload retries', async () => {
+        mockAxios.post!.mockImplementationOnce(() => Promise.reject(new Error('Token error')));
+
+        const results = await Promise.allSettled([runVertexOCR(), runVertexOCR()]);
+        expect(results.map(({ status }) => status)).toEqual(['rejected', 'rejected']);
+        expect(getTokenCalls()).toHaveLength(1);
+
+        await runVertexOCR();
+
+        expect(getTokenCalls()).toHaveLength(2);
+        expect(getAuthorizationHeaders()).toEqual(['Bearer access-token-1']);
+      });
+
+      it.each([401, 403])(
+        'should discard the cached token when Vertex AI responds with %i',
+        async (status) => {
+          await runVertexOCR();
+
+          mockAxios.post!.mockImplementationOnce(() =>
+            Promise.reject(Object.assign(new Error('Auth error'), { response: { status } })),
+          );
+          await expect(runVertexOCR()).rejects.toThrow();
+
+          await runVertexOCR();
+
+          expect(getTokenCalls()).toHaveLength(2);
+          expect(getAuthorizationHeaders()).toEqual([
+            'Bearer access-token-1',
+            'Bearer access-token-1',
+            'Bearer access-token-2',
+          ]);
+        },
+      );
+
+      it('should keep the cached token when Vertex AI fails for other reasons', async () => {
+        await runVertexOCR();
+
+        mockAxios.post!.mockImplementationOnce(() =>
+          Promise.reject(Object.assign(new Error('Server error'), { response: { status: 500 } })),
+        );
+        await expect(runVertexOCR()).rejects.toThrow();
+
+        await runVertexOCR();
+
+        expect(getTokenCalls()).toHaveLength(1);
+      });
+    });
+  });
 });
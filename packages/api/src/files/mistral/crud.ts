@@ -24,24 +24,35 @@ import type {
 import { logAxiosError, createAxiosInstance } from '~/utils/axios';
 import { readFileAsBuffer } from '~/utils/files';
 import { loadServiceKey } from '~/utils/key';
+import { mistralOCRState } from './state';
+import type { GoogleServiceAccount, GoogleAuthConfig } from './state';
 
 const axios = createAxiosInstance();
 const DEFAULT_MISTRAL_BASE_URL = 'https://api.mistral.ai/v1';
 const DEFAULT_MISTRAL_MODEL = 'mistral-ocr-latest';
 
+/**
+ * Returns a keep-alive proxy agent shared across requests for the current `PROXY` value,
+ * so the sequential upload, signed URL, OCR, and delete calls reuse pooled connections
+ * instead of each opening (and handshaking) a new one
+ */
+function getProxyAgent(): HttpsProxyAgent<string> | undefined {
+  const proxy = process.env.PROXY;
+  if (!proxy) {
+    return undefined;
+  }
+  if (mistralOCRState.proxyAgent?.proxy !== proxy) {
+    mistralOCRState.proxyAgent = { proxy, agent: new HttpsProxyAgent(proxy, { keepAlive: true }) };
+  }
+  return mistralOCRState.proxyAgent.agent;
+}
+
 /** Helper type for auth configuration */
 interface AuthConfig {
   apiKey: string;
   baseURL: string;
 }
 
-/** Helper type for Google service account */
-interface GoogleServiceAccount {
-  client_email?: string;
-  private_key?: string;
-  project_id?: string;
-}
-
 /** Helper type for OCR request context */
 interface OCRContext {
   req: ServerRequest;
@@ -88,8 +99,9 @@ export async function uploadDocumentToMistral({
     maxContentLength: Infinity,
   };
 
-  if (process.env.PROXY) {
-    config.httpsAgent = new HttpsProxyAgent(process.env.PROXY);
+  const proxyAgent = getProxyAgent();
+  if (proxyAgent) {
+    config.httpsAgent = proxyAgent;
   }
 
   return axios
@@ -117,8 +129,9 @@ export async function getSignedUrl({
     },
   };
 
-  if (process.env.PROXY) {
-    config.httpsAgent = new HttpsProxyAgent(process.env.PROXY);
+  const proxyAgent = getProxyAgent();
+  if (proxyAgent) {
+    config.httpsAgent = proxyAgent;
   }
 
   return axios
@@ -161,8 +174,9 @@ export async function performOCR({
     },
   };
 
-  if (process.env.PROXY) {
-    config.httpsAgent = new HttpsProxyAgent(process.env.PROXY);
+  const proxyAgent = getProxyAgent();
+  if (proxyAgent) {
+    config.httpsAgent = proxyAgent;
   }
 
   return axios
@@ -209,8 +223,9 @@ export async function deleteMistralFile({
     },
   };
 
-  if (process.env.PROXY) {
-    config.httpsAgent = new HttpsProxyAgent(process.env.PROXY);
+  const proxyAgent = getProxyAgent();
+  if (proxyAgent) {
+    config.httpsAgent = proxyAgent;
   }
 
   try {
@@ -317,14 +332,16 @@ function getModelConfig(ocrConfig?: TCustomConfig['ocr']): string {
   return modelConfig.trim();
 }
 
+/** Image file extensions sent to OCR as `image_url` when the mimetype is missing or generic */
+const imageExtensionRegex = /\.(png|jpe?g|gif|bmp|webp|tiff?)$/i;
+
 /**
  * Determines document type based on file
  */
 function getDocumentType(file: Express.Multer.File): 'image_url' | 'document_url' {
   const mimetype = (file.mimetype || '').toLowerCase();
-  const originalname = file.originalname || '';
   const isImage =
-    mimetype.startsWith('image') || /\.(png|jpe?g|gif|bmp|webp|tiff?)$/i.test(originalname);
+    mimetype.startsWith('image') || imageExtensionRegex.test(file.originalname || '');
 
   return isImage ? 'image_url' : 'document_url';
 }
@@ -502,17 +519,9 @@ export const uploadAzureMistralOCR = async (
 };
 
 /**
- * Loads Google service account configuration
+ * Loads and validates the Google service account from a key file path, URL, or stringified JSON
  */
-async function loadGoogleAuthConfig(): Promise<{
-  serviceAccount: GoogleServiceAccount;
-  accessToken: string;
-}> {
-  /** Path from environment variable or default location */
-  const serviceKeyPath =
-    process.env.GOOGLE_SERVICE_KEY_FILE ||
-    path.join(__dirname, '..', '..', '..', 'api', 'data', 'auth.json');
-
+async function loadGoogleServiceAccount(serviceKeyPath: string): Promise<GoogleServiceAccount> {
   const serviceKey = await loadServiceKey(serviceKeyPath);
 
   if (!serviceKey) {
@@ -525,15 +534,58 @@ async function loadGoogleAuthConfig(): Promise<{
     throw new Error('Invalid Google service account configuration');
   }
 
-  const jwt = await createJWT(serviceKey as GoogleServiceAccount);
-  const accessToken = await exchangeJWTForAccessToken(jwt);
+  return serviceKey as GoogleServiceAccount;
+}
+
+/** Refresh access tokens this long before Google reports them as expired */
+const ACCESS_TOKEN_REFRESH_MARGIN_MS = 5 * 60 * 1000;
+
+/**
+ * Re-resolves the service account and exchanges a freshly signed JWT for an access token
+ */
+async function refreshGoogleAuthConfig(serviceKeyPath: string): Promise<GoogleAuthConfig> {
+  const serviceAccount = await loadGoogleServiceAccount(serviceKeyPath);
+  const jwt = await createJWT(serviceAccount);
+  const { accessToken, expiresIn } = await exchangeJWTForAccessToken(jwt);
+
+  mistralOCRState.googleAuth = {
+    keyPath: serviceKeyPath,
+    serviceAccount,
+    accessToken,
+    expiresAt: Date.now() + expiresIn * 1000,
+  };
 
   return {
-    serviceAccount: serviceKey as GoogleServiceAccount,
+    serviceAccount,
     accessToken,
   };
 }
 
+/**
+ * Loads Google service account configuration and a valid access token, signing and
+ * exchanging a new JWT only when no cached token exists or the cached one is about to expire
+ */
+async function loadGoogleAuthConfig(): Promise<GoogleAuthConfig> {
+  /** Path from environment variable or default location */
+  const serviceKeyPath =
+    process.env.GOOGLE_SERVICE_KEY_FILE ||
+    path.join(__dirname, '..', '..', '..', 'api', 'data', 'auth.json');
+
+  const cached = mistralOCRState.googleAuth;
+  if (
+    cached?.keyPath === serviceKeyPath &&
+    Date.now() < cached.expiresAt - ACCESS_TOKEN_REFRESH_MARGIN_MS
+  ) {
+    const { serviceAccount, accessToken } = cached;
+    return { serviceAccount, accessToken };
+  }
+
+  mistralOCRState.pendingGoogleAuth ??= refreshGoogleAuthConfig(serviceKeyPath).finally(() => {
+    mistralOCRState.pendingGoogleAuth = undefined;
+  });
+  return mistralOCRState.pendingGoogleAuth;
+}
+
 /**
  * Creates a JWT token manually
  */
@@ -569,17 +621,20 @@ async function createJWT(serviceKey: GoogleServiceAccount): Promise<string> {
 }
 
 /**
- * Exchanges JWT for access token
+ * Exchanges JWT for access token and its lifetime in seconds
  */
-async function exchangeJWTForAccessToken(jwt: string): Promise<string> {
+async function exchangeJWTForAccessToken(
+  jwt: string,
+): Promise<{ accessToken: string; expiresIn: number }> {
   const config: AxiosRequestConfig = {
     headers: {
       'Content-Type': 'application/x-www-form-urlencoded',
     },
   };
 
-  if (process.env.PROXY) {
-    config.httpsAgent = new HttpsProxyAgent(process.env.PROXY);
+  const proxyAgent = getProxyAgent();
+  if (proxyAgent) {
+    config.httpsAgent = proxyAgent;
   }
 
   const response = await axios.post(
@@ -595,7 +650,10 @@ async function exchangeJWTForAccessToken(jwt: string): Promise<string> {
     throw new Error('No access token in response');
   }
 
-  return response.data.access_token;
+  return {
+    accessToken: response.data.access_token,
+    expiresIn: Number(response.data.expires_in) || 3600,
+  };
 }
 
 /**
@@ -651,8 +709,9 @@ async function performGoogleVertexOCR({
     },
   };
 
-  if (process.env.PROXY) {
-    config.httpsAgent = new HttpsProxyAgent(process.env.PROXY);
+  const proxyAgent = getProxyAgent();
+  if (proxyAgent) {
+    config.httpsAgent = proxyAgent;
   }
 
   return axios
@@ -665,6 +724,14 @@ async function performGoogleVertexOCR({
       if (error.response?.data) {
         logger.error('Vertex AI error response: ' + JSON.stringify(error.response.data, null, 2));
       }
+      /** Drop a rejected token so the next upload mints a new one instead of reusing it */
+      const status = error.response?.status;
+      if (
+        (status === 401 || status === 403) &&
+        mistralOCRState.googleAuth?.accessToken === accessToken
+      ) {
+        mistralOCRState.googleAuth = undefined;
+      }
       throw new Error(
         logAxiosError({
           error: error as AxiosError,
@@ -0,0 +1,37 @@
+import type { HttpsProxyAgent } from 'https-proxy-agent';
+
+/** Helper type for Google service account */
+export interface GoogleServiceAccount {
+  client_email?: string;
+  private_key?: string;
+  project_id?: string;
+}
+
+/** Helper type for resolved Google Vertex AI auth */
+export interface GoogleAuthConfig {
+  serviceAccount: GoogleServiceAccount;
+  accessToken: string;
+}
+
+/**
+ * Module-level state shared between Mistral OCR requests.
+ * Not re-exported from the `files` barrel, so it stays out of the package's public API.
+ */
+export const mistralOCRState: {
+  /** Keep-alive proxy agent for the current `PROXY` value */
+  proxyAgent?: { proxy: string; agent: HttpsProxyAgent<string> };
+  /**
+   * Service account and access token shared by all Vertex OCR uploads in the process.
+   * The key is re-resolved each time the token is refreshed, so a rotated key file (or a
+   * changed key URL response) is picked up within one token lifetime without a restart.
+   * Failed loads are never cached.
+   */
+  googleAuth?: {
+    keyPath: string;
+    serviceAccount: GoogleServiceAccount;
+    accessToken: string;
+    expiresAt: number;
+  };
+  /** In-flight refresh shared by concurrent uploads, so only one JWT is signed and exchanged */
+  pendingGoogleAuth?: Promise<GoogleAuthConfig>;
+} = {};
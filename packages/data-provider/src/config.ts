@@ -1169,6 +1169,12 @@ export const visionModels = [
   'claude-sonnet-4',
   'claude-haiku-4',
 ];
+
+/** Matches any known `visionModels` entry as a substring; compiled once instead of per call */
+const visionModelsPattern = new RegExp(
+  visionModels.map((visionModel) => visionModel.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')).join('|'),
+);
+
 export enum VisionModes {
   generative = 'generative',
   agents = 'agents',
@@ -1195,7 +1201,11 @@ export function validateVisionModel({
     return false;
   }
 
-  return visionModels.concat(additionalModels).some((visionModel) => model.includes(visionModel));
+  if (visionModelsPattern.test(model)) {
+    return true;
+  }
+
+  return additionalModels.some((visionModel) => model.includes(visionModel));
 }
 
 export const imageGenTools = new Set(['dalle', 'dall-e', 'stable-diffusion', 'flux']);